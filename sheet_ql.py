@@ -6,54 +6,86 @@ flat files (CSV, Excel, Parquet, JSON) using SQL.
 
 Architecture:
 - CSV/Parquet/JSON: Uses DuckDB's "Zero-Copy" views for high performance on large files.
-- Excel: Uses Pandas to bridge data into DuckDB (requires memory for loading).
+- Excel: Uses DuckDB's native `excel` extension (read_xlsx views) when it can be
+  loaded, otherwise Pandas bridges the data into DuckDB (requires memory for loading).
 """
 
 import os
 import re
 import argparse
+import tempfile
+import itertools
+import shlex
+import hashlib
+import datetime
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 import logging
-from collections import deque
-from typing import Any, Optional, List, Tuple, Dict
+from bisect import bisect_left
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Optional,
+    List,
+    Tuple,
+    Dict,
+    Iterable,
+    Iterator,
+    Union,
+    FrozenSet,
+)
 from importlib.util import find_spec
 
-import pandas as pd
 import duckdb
+import pyarrow as pa
+import pyarrow.compute as pc
 from rich.console import Console
 from rich.logging import RichHandler
 from rich.table import Table
-from openpyxl.styles import Font, PatternFill
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Characters that are not valid in unquoted table/column identifiers.
+_SANITIZE_RE = re.compile(r"[^a-zA-Z0-9_]+")
+
+# Lowercased sort keys alongside their (text, meta) completion entries.
+CompletionIndex = Tuple[List[str], List[Tuple[str, str]]]
+
+# Staged export data: SELECTs stay unexecuted relations until they are saved.
+StagedResult = Union[pa.Table, duckdb.DuckDBPyRelation]
 
 # --- OPTIONAL DEPENDENCIES ---
+# Probed without importing; tkinter, pygments and the Excel writers are
+# imported on first use to keep startup (and batch runs) fast.
 CALAMINE_AVAILABLE = find_spec("python_calamine") is not None
 XLSXWRITER_AVAILABLE = find_spec("xlsxwriter") is not None
+TKINTER_AVAILABLE = find_spec("_tkinter") is not None
+READLINE_AVAILABLE = find_spec("readline") is not None
 
 try:
     from prompt_toolkit import PromptSession
     from prompt_toolkit.completion import Completer, Completion
-    from prompt_toolkit.lexers import PygmentsLexer
-    from pygments.lexers.sql import SqlLexer
-    from prompt_toolkit.styles import Style
+    from prompt_toolkit.history import FileHistory
 
-    PROMPT_TOOLKIT_AVAILABLE = True
+    PROMPT_TOOLKIT_AVAILABLE = find_spec("pygments") is not None
 except ImportError:
     PROMPT_TOOLKIT_AVAILABLE = False
 
 try:
     import yaml
 
+    try:
+        from yaml import CSafeDumper as YamlDumper
+        from yaml import CSafeLoader as YamlLoader
+    except ImportError:
+        from yaml import SafeDumper as YamlDumper
+        from yaml import SafeLoader as YamlLoader
+
     YAML_AVAILABLE = True
 except ImportError:
     YAML_AVAILABLE = False
 
-try:
-    import tkinter as tk
-    from tkinter import filedialog
-
-    TKINTER_AVAILABLE = True
-except ImportError:
-    TKINTER_AVAILABLE = False
-
 
 def setup_logging(debug_mode: bool = False) -> logging.Logger:
     """Configures the application logging system."""
@@ -82,6 +114,135 @@ def setup_logging(debug_mode: bool = False) -> logging.Logger:
     return logger
 
 
+def _fetch_arrow_table(result: duckdb.DuckDBPyConnection) -> pa.Table:
+    """Fetches a DuckDB result as Arrow (to_arrow_table on newer DuckDB releases)."""
+    fetch = getattr(result, "to_arrow_table", None) or result.fetch_arrow_table
+    return fetch()
+
+
+def _fetch_arrow_reader(
+    result: duckdb.DuckDBPyConnection, batch_size: int
+) -> pa.RecordBatchReader:
+    """Streams a DuckDB result as Arrow batches (to_arrow_reader on newer DuckDB)."""
+    fetch = getattr(result, "to_arrow_reader", None) or result.fetch_record_batch
+    return fetch(batch_size)
+
+
+def _text_width(column: pa.ChunkedArray) -> int:
+    """Length of the longest value in an Arrow column once rendered as text."""
+    if pa.types.is_timestamp(column.type):
+        return 19  # Matches the workbook's default date format.
+    try:
+        return pc.max(pc.utf8_length(pc.cast(column, pa.string()))).as_py() or 0
+    except (pa.ArrowNotImplementedError, pa.ArrowInvalid):
+        # No string cast (nested types) or not valid UTF-8 (BLOBs): measure
+        # the text the workbook writer falls back to.
+        return max((len(str(v)) for v in column.to_pylist()), default=0)
+
+
+def _arrow_from_pandas(df: "pd.DataFrame") -> pa.Table:
+    """Converts a DataFrame to Arrow, stringifying mixed-type columns like DuckDB does."""
+    import pandas as pd
+
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False, nthreads=os.cpu_count())
+    except (pa.ArrowException, TypeError, ValueError):
+        pass
+    df = df.copy(deep=False)
+    for name in df.select_dtypes(include="object").columns:
+        try:
+            pa.array(df[name], from_pandas=True)
+        except (pa.ArrowException, TypeError, ValueError):
+            df[name] = df[name].map(lambda v: None if pd.isna(v) else str(v))
+    return pa.Table.from_pandas(df, preserve_index=False, nthreads=os.cpu_count())
+
+
+def _cells_to_arrow(values: Iterable[Any]) -> pa.Array:
+    """Builds one Arrow column from raw sheet cells (blank cells become nulls)."""
+    values = [None if v == "" else v for v in values]
+    # Readers return midnight timestamps as dates; keep the column a timestamp.
+    if any(isinstance(v, datetime.datetime) for v in values):
+        values = [
+            (
+                datetime.datetime.combine(v, datetime.time())
+                if type(v) is datetime.date
+                else v
+            )
+            for v in values
+        ]
+    array = pa.array(values)
+    # Spreadsheets store every number as a float; whole-number columns are ints.
+    if pa.types.is_floating(array.type) and array.null_count < len(array):
+        if pc.all(pc.equal(array, pc.floor(array))).as_py():
+            try:
+                array = array.cast(pa.int64())
+            except pa.ArrowInvalid:
+                pass
+    return array
+
+
+def _rows_to_arrow(rows: List[Any]) -> Optional[pa.Table]:
+    """Turns a sheet's rows (header first) into Arrow, or None if it needs pandas.
+
+    A blank sheet gives a table with no columns, which callers skip.
+    """
+    while rows and all(v is None or v == "" for v in rows[-1]):
+        rows.pop()
+    if not rows:
+        return pa.table({})
+    sub = _SANITIZE_RE.sub
+    header = [
+        f"unnamed_{i}" if h is None or h == "" else sub("_", str(h).strip()).lower()
+        for i, h in enumerate(rows[0])
+    ]
+    if not header or len(set(header)) != len(header):
+        return None
+    try:
+        columns = list(zip(*rows[1:])) or [()] * len(header)
+        return pa.table([_cells_to_arrow(col) for col in columns], names=header)
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+
+
+def _split_path_list(text: str) -> List[str]:
+    """Splits comma-separated paths; double quotes keep commas in a path.
+
+    Backslashes and apostrophes (O'Brien) are ordinary characters.
+    """
+    lexer = shlex.shlex(text, posix=True)
+    lexer.whitespace = ","
+    lexer.whitespace_split = True
+    lexer.commenters = ""
+    lexer.escape = ""
+    lexer.quotes = '"'
+    try:
+        parts = list(lexer)
+    except ValueError:  # Unbalanced quote: fall back to a plain split.
+        parts = [p.strip('"') for p in text.split(",")]
+    return [p.strip() for p in parts if p.strip()]
+
+
+def _write_as_text(worksheet, row, col, value, cell_format=None):
+    """xlsxwriter handler for nested values (lists, structs) it cannot store."""
+    return worksheet.write_string(row, col, str(value), cell_format)
+
+
+def _write_interval(worksheet, row, col, value, cell_format=None):
+    """xlsxwriter handler writing Arrow intervals as ISO 8601 durations (P1M2DT3S)."""
+    seconds = f"{value.nanoseconds / 1e9:.9f}".rstrip("0").rstrip(".")
+    text = f"P{value.months}M{value.days}DT{seconds}S"
+    return worksheet.write_string(row, col, text, cell_format)
+
+
+def setup_arrow_memory_pool(logger: logging.Logger) -> None:
+    """Routes Arrow allocations through jemalloc when the pyarrow build ships it."""
+    try:
+        pa.set_memory_pool(pa.jemalloc_memory_pool())
+    except (NotImplementedError, pa.ArrowException):
+        pass
+    logger.debug(f"Arrow memory pool: {pa.default_memory_pool().backend_name}")
+
+
 class SessionRecorder:
     """Records session activities to generate YAML scripts."""
 
@@ -111,7 +272,9 @@ class SessionRecorder:
             script["tasks"] = self.transformations
         if self.exports:
             script["export"] = self.exports[-1]
-        return yaml.safe_dump(script, sort_keys=False, default_flow_style=False)
+        return yaml.dump(
+            script, Dumper=YamlDumper, sort_keys=False, default_flow_style=False
+        )
 
 
 class SheetQLCompleter(Completer):
@@ -144,33 +307,75 @@ class SheetQLCompleter(Completer):
             "SHOW TABLES",
             "EXPORT",
         ]
+        self._keyword_index = self._build_index((k, "Keyword") for k in self.keywords)
+        self._table_index: Optional[CompletionIndex] = None
+        self._column_index: Optional[CompletionIndex] = None
+
+    def invalidate(self) -> None:
+        """Drops the cached table/column index after the schema changes."""
+        self._table_index = None
+        self._column_index = None
+
+    @staticmethod
+    def _build_index(entries: Iterable[Tuple[str, str]]) -> CompletionIndex:
+        ordered = sorted(entries, key=lambda entry: entry[0].lower())
+        return [entry[0].lower() for entry in ordered], ordered
+
+    @staticmethod
+    def _prefix_matches(
+        index: CompletionIndex, prefix: str
+    ) -> Iterator[Tuple[str, str]]:
+        keys, entries = index
+        i = bisect_left(keys, prefix)
+        while i < len(keys) and keys[i].startswith(prefix):
+            yield entries[i]
+            i += 1
+
+    def _ensure_index(self) -> None:
+        if self._table_index is None or self._column_index is None:
+            tables = list(self.schema_cache.keys())
+            self._table_index = self._build_index((t, "Table") for t in tables)
+            self._column_index = self._build_index(
+                (c, f"Column ({t})") for t in tables for c in self.schema_cache[t]
+            )
+
+    @staticmethod
+    def _previous_token(text: str, word: str) -> str:
+        """Uppercases the token before the word being typed, scanning backwards."""
+        end = len(text) - len(word)
+        while end > 0 and text[end - 1].isspace():
+            end -= 1
+        start = end
+        while start > 0 and not text[start - 1].isspace():
+            start -= 1
+        return text[start:end].upper()
 
     def get_completions(self, document, complete_event):
         word = document.get_word_before_cursor(WORD=True)
-        upper_text = document.text_before_cursor.upper()
-        parts = upper_text.split()
-        last_word = ""
-
-        if parts:
-            if document.text_before_cursor.endswith(" ") or word == "":
-                last_word = parts[-1]
-            elif len(parts) > 1:
-                last_word = parts[-2]
-
-        tables = list(self.schema_cache.keys())
-        suggestions = []
+        # While typing, a blank word would list every keyword, table and column
+        # after each space; only do that when Tab explicitly asks for it.
+        if not word and not getattr(complete_event, "completion_requested", False):
+            return
+        last_word = self._previous_token(document.text_before_cursor, word)
 
-        if last_word in ["FROM", "JOIN", "UPDATE", "INTO", "DESCRIBE"]:
-            suggestions.extend([(t, "Table") for t in tables])
+        self._ensure_index()
+        # Meta-commands that take a table name complete like a FROM clause.
+        if last_word in [
+            "FROM",
+            "JOIN",
+            "UPDATE",
+            "INTO",
+            "DESCRIBE",
+            ".SCHEMA",
+            ".RENAME",
+        ]:
+            indexes = [self._table_index]
         else:
-            suggestions.extend([(k, "Keyword") for k in self.keywords])
-            suggestions.extend([(t, "Table") for t in tables])
-            for table_name in tables:
-                cols = self.schema_cache.get(table_name, [])
-                suggestions.extend([(c, f"Column ({table_name})") for c in cols])
-
-        for suggestion, meta in suggestions:
-            if suggestion.lower().startswith(word.lower()):
+            indexes = [self._keyword_index, self._table_index, self._column_index]
+
+        prefix = word.lower()
+        for index in indexes:
+            for suggestion, meta in self._prefix_matches(index, prefix):
                 yield Completion(
                     suggestion, start_position=-len(word), display_meta=meta
                 )
@@ -182,22 +387,102 @@ class SheetQL:
     PROMPT_SQL = "SQL> "
     PROMPT_CONTINUE = "  -> "
     DEFAULT_EXPORT_FILENAME = "query_result.xlsx"
+    EXCEL_MAX_ROWS = 1_048_575  # Worksheet row limit, excluding the header row.
+    MAX_COLUMN_WIDTH = 60
+    LOAD_WORKERS = min(8, os.cpu_count() or 1)
     HISTORY_MAX_LEN = 50
-
-    def __init__(self, logger: logging.Logger) -> None:
+    PREVIEW_ROWS = 15
+    BATCH_ROWS = 10_000
+    PREVIEW_BATCH_ROWS = 2048  # One DuckDB vector.
+    QUERY_CACHE_SIZE = 16
+    # Keyword forms of the clock functions, plus the volatile functions for
+    # DuckDB builds whose duckdb_functions() has no stability column.
+    VOLATILE_SQL_WORDS = frozenset(
+        {
+            "current_date",
+            "current_time",
+            "current_timestamp",
+            "localtime",
+            "localtimestamp",
+            "now",
+            "today",
+            "random",
+            "uuid",
+            "gen_random_uuid",
+            "nextval",
+        }
+    )
+    HISTORY_FILE = "~/.sheetql_history"
+    READLINE_HISTORY_FILE = "~/.sheetql_readline_history"
+
+    # File extension -> loader method; each returns the tables it created.
+    LOADERS: Dict[str, str] = {
+        ".parquet": "_load_parquet_file",
+        ".csv": "_load_csv_file",
+        ".json": "_load_json_file",
+        ".jsonl": "_load_json_file",
+        ".ndjson": "_load_json_file",
+        ".xlsx": "_load_excel_file",
+        ".xls": "_load_excel_file",
+    }
+
+    # Meta-command -> (handler method, whether it takes the split command line).
+    META_COMMANDS: Dict[str, Tuple[str, bool]] = {
+        ".exit": ("_request_exit", False),
+        ".quit": ("_request_exit", False),
+        ".help": ("_show_help", False),
+        ".tables": ("_list_tables", False),
+        ".schema": ("_describe_table", True),
+        ".history": ("_show_history", False),
+        ".load": ("_add_new_files", False),
+        ".export": ("_export_results", False),
+        ".dump": ("_dump_script", True),
+        ".runscript": ("_run_script_interactive", True),
+        ".rename": ("_rename_table", True),
+    }
+
+    def __init__(
+        self, logger: logging.Logger, materialize: bool = False, gui: bool = False
+    ) -> None:
         self.logger = logger
+        # Copy loaded data into DuckDB tables instead of linking views over it.
+        self.materialize = materialize
+        # Tk file dialogs are opt-in; paths are typed (with completion) otherwise.
+        self.use_gui = gui and TKINTER_AVAILABLE
         self.console = Console()
         self.db_connection: Optional[duckdb.DuckDBPyConnection] = None
-        self.results_to_save: Dict[str, pd.DataFrame] = {}
-        self.history: deque[str] = deque(maxlen=self.HISTORY_MAX_LEN)
+        self.results_to_save: Dict[str, StagedResult] = {}
         self.schema_cache: Dict[str, List[str]] = {}
+        self.column_types: Dict[str, List[str]] = {}
         self.recorder = SessionRecorder()
 
         self.loaded_files_map: Dict[str, List[str]] = {}
+        self._excel_extension_loaded: Optional[bool] = None
+        # SHOW TABLES result, dropped whenever the catalog may have changed.
+        self._table_names: Optional[List[str]] = None
+        # Preview rows of recent SELECTs, keyed by a digest of the query text
+        # and the loaded files' fingerprints.
+        self._query_cache: "OrderedDict[str, pa.Table]" = OrderedDict()
+        # Names of functions whose results change between runs (now, random).
+        self._volatile_functions: Optional[FrozenSet[str]] = None
+        self._tk_root: Any = None
+        # Workbook reads started on the load pool, keyed by path.
+        self._pending_sheets: Dict[str, Future] = {}
+        self._path_session: Any = None
+        # How each loaded table is bound: "view", "registered" or "table".
+        self._table_sources: Dict[str, str] = {}
+        # File each table name was last loaded from.
+        self._table_paths: Dict[str, str] = {}
+        # (size, mtime_ns) of each file as of its last successful load.
+        self._file_fingerprints: Dict[str, Tuple[int, int]] = {}
 
         self.session = None
+        self.completer = None
         if PROMPT_TOOLKIT_AVAILABLE:
-            self.session = PromptSession(history=None)
+            self.session = PromptSession(
+                history=FileHistory(os.path.expanduser(self.HISTORY_FILE))
+            )
+            self.completer = SheetQLCompleter(self.schema_cache)
 
     def run_interactive(self) -> None:
         try:
@@ -223,6 +508,9 @@ class SheetQL:
         except Exception as e:
             self.logger.critical(f"Fatal error in interactive loop: {e}", exc_info=True)
         finally:
+            if self._tk_root is not None:
+                self._tk_root.destroy()
+                self._tk_root = None
             self.logger.info("[bold cyan]👋 Goodbye![/bold cyan]")
 
     def run_batch(self, config_path: str) -> None:
@@ -232,8 +520,7 @@ class SheetQL:
             return
 
         try:
-            with open(config_path, "r") as f:
-                config = yaml.safe_load(f)
+            config = self._read_yaml(config_path)
         except Exception as e:
             self.logger.error(f"Failed to load config: {e}")
             return
@@ -241,12 +528,45 @@ class SheetQL:
         self._init_db()
         self._execute_yaml_script(config)
 
+    @staticmethod
+    def _read_yaml(path: str) -> Any:
+        """Parses a YAML script, letting libyaml decode the raw bytes itself."""
+        with open(path, "rb") as f:
+            return yaml.load(f, Loader=YamlLoader)
+
     def _init_db(self) -> None:
+        config = {
+            "threads": str(os.cpu_count() or 4),
+            "enable_object_cache": "true",
+            "temp_directory": os.path.join(tempfile.gettempdir(), "duckdb_sheetql"),
+        }
+        if memory_limit := self._memory_limit():
+            config["memory_limit"] = memory_limit
+
+        try:
+            self.db_connection = duckdb.connect(database=":memory:", config=config)
+            return
+        except duckdb.Error as e:
+            self.logger.debug(f"DuckDB rejected connection config: {e}")
+
+        # Apply what this DuckDB build accepts, one setting at a time.
         self.db_connection = duckdb.connect(database=":memory:")
+        for key, value in config.items():
+            try:
+                self.db_connection.execute(
+                    f"SET {key}='{self._escape_sql_path(value)}'"
+                )
+            except Exception:
+                self.logger.debug(f"DuckDB rejected '{key}={value}'. Using default.")
+
+    @staticmethod
+    def _memory_limit(fraction: float = 0.75) -> Optional[str]:
+        """Returns a DuckDB memory_limit for a share of physical RAM, if detectable."""
         try:
-            self.db_connection.execute("SET memory_limit='75%';")
-        except Exception:
-            self.logger.debug("DuckDB memory limit config failed. Using defaults.")
+            total = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+        except (AttributeError, ValueError, OSError):
+            return None
+        return f"{int(total * fraction) // (1024 * 1024)}MiB"
 
     def _display_welcome(self) -> None:
         self.console.print("[bold green]--- SheetQL Professional ---[/bold green]")
@@ -271,45 +591,69 @@ class SheetQL:
         )
         self.console.print(f"Engine Status: {', '.join(status)}")
 
+    def _tk_root_window(self) -> Any:
+        """Returns the hidden Tk root shared by all dialogs, creating it once."""
+        if self._tk_root is None:
+            import tkinter as tk
+
+            self._tk_root = tk.Tk()
+            self._tk_root.withdraw()
+        return self._tk_root
+
+    def _read_path(self, label: str) -> str:
+        """Reads a typed path, completing file names when prompt_toolkit is present."""
+        if not PROMPT_TOOLKIT_AVAILABLE:
+            return self.console.input(f"[bold]{label}[/bold]")
+        if self._path_session is None:
+            from prompt_toolkit.completion import PathCompleter
+
+            # Separate from the SQL session so paths stay out of query history.
+            self._path_session = PromptSession(completer=PathCompleter(expanduser=True))
+        return self._path_session.prompt(label)
+
     def _prompt_for_paths(
         self, title: str, filetypes: List[Tuple[str, str]], allow_multiple: bool
     ) -> Optional[List[str]]:
-        if TKINTER_AVAILABLE:
-            root = tk.Tk()
-            root.withdraw()
+        if self.use_gui:
+            from tkinter import filedialog
+
+            root = self._tk_root_window()
+            options = {"parent": root, "title": title, "filetypes": filetypes}
             if allow_multiple:
-                paths = filedialog.askopenfilenames(title=title, filetypes=filetypes)
+                paths = filedialog.askopenfilenames(**options)
             else:
-                paths = [filedialog.askopenfilename(title=title, filetypes=filetypes)]
-            root.destroy()
+                paths = [filedialog.askopenfilename(**options)]
             return list(paths) if paths and paths[0] else None
 
         self.console.print(f"\n[cyan]Enter paths for: {title}[/cyan]")
-        paths_input = self.console.input("[bold]Path(s): [/bold]")
-        raw_paths = [p.strip().strip("'\"") for p in paths_input.split(",")]
-        return [p for p in raw_paths if p and os.path.exists(p)]
+        paths = map(os.path.expanduser, _split_path_list(self._read_path("Path(s): ")))
+        return [p for p in paths if os.path.isfile(p)]
 
     def _prompt_for_save_path(self) -> Optional[str]:
         """Prompts the user for a new file save path."""
-        if TKINTER_AVAILABLE:
-            root = tk.Tk()
-            root.withdraw()
+        if self.use_gui:
+            from tkinter import filedialog
 
+            root = self._tk_root_window()
             root.lift()
             root.attributes("-topmost", True)
 
             save_path = filedialog.asksaveasfilename(
+                parent=root,
                 title="Select Save Location",
                 initialfile=self.DEFAULT_EXPORT_FILENAME,
                 defaultextension=".xlsx",
-                filetypes=[("Excel Files", "*.xlsx")],
+                filetypes=[
+                    ("Excel Files", "*.xlsx"),
+                    ("Parquet Files", "*.parquet"),
+                    ("Arrow IPC Files", "*.arrow"),
+                ],
             )
-            root.destroy()
             return save_path if save_path else None
 
         self.console.print("\n[cyan]Please enter a save path for the export.[/cyan]")
-        save_path_input = self.console.input(
-            f"[bold]Save path (default: {self.DEFAULT_EXPORT_FILENAME}): [/bold]"
+        save_path_input = os.path.expanduser(
+            self._read_path(f"Save path (default: {self.DEFAULT_EXPORT_FILENAME}): ")
         )
         if not save_path_input:
             save_path_input = self.DEFAULT_EXPORT_FILENAME
@@ -329,216 +673,789 @@ class SheetQL:
         """Escapes single quotes in file paths to prevent SQL injection/errors."""
         return path.replace("'", "''")
 
+    def _quote_identifier(self, name: str) -> str:
+        """Double-quotes a table/column name so any characters are accepted."""
+        return '"' + name.replace('"', '""') + '"'
+
     def _load_data(self, file_paths: List[str]) -> List[str]:
         if not self.db_connection:
             return []
         loaded_tables = []
+        known = set(self._table_sources)
+        fingerprints = {path: self._fingerprint(path) for path in file_paths}
+        sources = {path: self._split_source(path) for path in file_paths}
+        unchanged = [
+            path for path in file_paths if self._is_unchanged(path, fingerprints[path])
+        ]
+
+        from rich.progress import (
+            BarColumn,
+            MofNCompleteColumn,
+            Progress,
+            SpinnerColumn,
+            TextColumn,
+            TimeElapsedColumn,
+        )
 
-        with self.console.status("[bold green]Linking files...[/bold green]"):
+        progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[bold green]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            console=self.console,
+            transient=True,
+        )
+        with progress, ThreadPoolExecutor(max_workers=self.LOAD_WORKERS) as pool:
+            # Workbook parsing runs on worker threads; all DuckDB catalog work
+            # (views, registrations) stays on this thread's connection.
             for file_path in file_paths:
-                try:
-                    clean_path = str(file_path).replace("\\", "/")
-                    sql_safe_path = self._escape_sql_path(clean_path)
-
-                    ext = os.path.splitext(file_path)[1].lower()
-                    base = re.sub(
-                        r"[^a-zA-Z0-9_]+",
-                        "_",
-                        os.path.splitext(os.path.basename(file_path))[0],
+                base, ext = sources[file_path]
+                if file_path in unchanged:
+                    continue
+                if ext == ".xls" or (
+                    ext == ".xlsx" and not self._load_excel_extension()
+                ):
+                    self._pending_sheets[file_path] = pool.submit(
+                        self._read_excel, file_path, base
                     )
-                    table_name = ""
-
-                    generated_tables = []
-
-                    if ext == ".parquet":
-                        table_name = f"{base}_parquet"
-                        self.db_connection.execute(
-                            f"CREATE OR REPLACE VIEW {table_name} AS SELECT * FROM '{sql_safe_path}'"
-                        )
-                        generated_tables.append(table_name)
-                    elif ext == ".csv":
-                        table_name = f"{base}_csv"
-                        self.db_connection.execute(
-                            f"CREATE OR REPLACE VIEW {table_name} AS SELECT * FROM read_csv_auto('{sql_safe_path}')"
-                        )
-                        generated_tables.append(table_name)
-                    elif ext in [".json", ".jsonl"]:
-                        table_name = f"{base}_json"
-                        self.db_connection.execute(
-                            f"CREATE OR REPLACE VIEW {table_name} AS SELECT * FROM read_json_auto('{sql_safe_path}')"
-                        )
-                        generated_tables.append(table_name)
-
-                    elif ext in [".xlsx", ".xls"]:
-                        engine = "calamine" if CALAMINE_AVAILABLE else None
-                        try:
-                            context = pd.ExcelFile(file_path, engine=engine)
-                        except Exception:
-                            context = pd.ExcelFile(file_path)
-
-                        with context as xls:
-                            for sheet in xls.sheet_names:
-                                df = pd.read_excel(xls, sheet_name=sheet)
-                                df.columns = [
-                                    re.sub(
-                                        r"[^a-zA-Z0-9_]+", "_", str(c).strip()
-                                    ).lower()
-                                    for c in df.columns
-                                ]
-                                clean_sheet = re.sub(
-                                    r"[^a-zA-Z0-9_]+", "_", sheet
-                                ).lower()
-
-                                table_name = f"{base}_{clean_sheet}"
-                                self.db_connection.register(table_name, df)
-
-                                loaded_tables.append(table_name)
-                                generated_tables.append(table_name)
-                                self.recorder.record_load(file_path, table_name)
-
-                        self.loaded_files_map[file_path] = generated_tables
-                        self._update_schema_cache(generated_tables)
-                        continue
-
-                    else:
-                        self.logger.warning(f"Skipping unsupported type: {ext}")
-                        continue
 
+            task = progress.add_task("Linking files...", total=len(file_paths))
+            for file_path in progress.track(file_paths, task_id=task):
+                progress.update(task, description=os.path.basename(file_path))
+                if file_path in unchanged:
+                    # Same size and mtime as last time: keep the existing tables.
+                    loaded_tables.extend(self.loaded_files_map[file_path])
+                    continue
+                base, ext = sources[file_path]
+                loader = self.LOADERS.get(ext)
+                if loader is None:
+                    self.logger.warning(f"Skipping unsupported type: {ext}")
+                    continue
+                try:
+                    sql_safe_path = self._escape_sql_path(
+                        str(file_path).replace("\\", "/")
+                    )
+                    generated_tables = getattr(self, loader)(
+                        file_path, base, sql_safe_path
+                    )
                     if generated_tables:
                         loaded_tables.extend(generated_tables)
                         self.loaded_files_map[file_path] = generated_tables
+                        if fingerprints[file_path]:
+                            self._file_fingerprints[file_path] = fingerprints[file_path]
                         for t in generated_tables:
+                            self._table_paths[t] = file_path
                             self.recorder.record_load(file_path, t)
 
                 except Exception as e:
                     self.logger.error(f"Failed to load '{file_path}': {e}")
-
+            self._pending_sheets.clear()
+
+        skipped = {t for path in unchanged for t in self.loaded_files_map[path]}
+        replaced = sorted(
+            {
+                t
+                for t in loaded_tables
+                if t not in skipped and (t in known or loaded_tables.count(t) > 1)
+            }
+        )
+        loaded_tables = list(dict.fromkeys(loaded_tables))
         self._update_schema_cache(loaded_tables)
-        self.logger.info(f"✔ Loaded {len(loaded_tables)} tables.")
+        summary = f"✔ Loaded {len(loaded_tables)} tables."
+        if skipped:
+            summary += f" Unchanged: {', '.join(sorted(skipped))}."
+        if replaced:
+            summary += f" Replaced: {', '.join(replaced)}."
+        self.logger.info(summary)
         return loaded_tables
 
-    def _update_schema_cache(self, table_names: List[str]) -> None:
-        if not self.db_connection:
+    def _load_parquet_file(
+        self, file_path: str, base: str, sql_safe_path: str
+    ) -> List[str]:
+        table_name = f"{base}_parquet"
+        self._create_view(table_name, f"SELECT * FROM read_parquet('{sql_safe_path}')")
+        return [table_name]
+
+    def _load_csv_file(
+        self, file_path: str, base: str, sql_safe_path: str
+    ) -> List[str]:
+        table_name = f"{base}_csv"
+        try:
+            self._create_view(
+                table_name, f"SELECT * FROM read_csv_auto('{sql_safe_path}')"
+            )
+        except duckdb.Error as e:
+            self.logger.debug(f"DuckDB CSV reader failed for '{file_path}': {e}")
+            self._load_csv_fallback(file_path, table_name)
+        return [table_name]
+
+    def _load_json_file(
+        self, file_path: str, base: str, sql_safe_path: str
+    ) -> List[str]:
+        table_name = f"{base}_json"
+        self._create_view(
+            table_name, f"SELECT * FROM read_json_auto('{sql_safe_path}')"
+        )
+        return [table_name]
+
+    def _load_excel_file(
+        self, file_path: str, base: str, sql_safe_path: str
+    ) -> List[str]:
+        if file_path.lower().endswith(".xlsx") and self._load_excel_extension():
+            try:
+                if tables := self._link_excel_native(file_path, base, sql_safe_path):
+                    return tables
+            except Exception as e:
+                self.logger.debug(f"Native Excel reader failed for '{file_path}': {e}")
+
+        future = self._pending_sheets.pop(file_path, None)
+        sheets = future.result() if future else self._read_excel(file_path, base)
+        # One transaction per workbook: all sheets or none. A rollback restores
+        # the old bindings, so their bookkeeping is restored with them.
+        sources = dict(self._table_sources)
+        self.db_connection.begin()
+        try:
+            for table_name, data in sheets:
+                self._register_table(table_name, data)
+            self.db_connection.commit()
+        except Exception:
+            self.db_connection.rollback()
+            self._table_sources = sources
+            raise
+        return [name for name, _ in sheets]
+
+    @staticmethod
+    def _fingerprint(path: str) -> Optional[Tuple[int, int]]:
+        """(size, mtime_ns) of a file, or None when it cannot be stat'ed."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def _is_unchanged(self, path: str, fingerprint: Optional[Tuple[int, int]]) -> bool:
+        """True when a file was loaded before and its tables still exist unchanged."""
+        if fingerprint is None or self._file_fingerprints.get(path) != fingerprint:
+            return False
+        tables = self._current_tables()
+        return all(
+            t in tables and self._table_paths.get(t) == path
+            for t in self.loaded_files_map[path]
+        )
+
+    def _release_table_name(self, name: str) -> None:
+        """Drops the object an earlier load bound to name before it is reused.
+
+        A registered object shadows a view of the same name, so replacing one
+        kind with the other must remove the old binding explicitly.
+        """
+        kind = self._table_sources.pop(name, None)
+        if kind == "registered":
+            self.db_connection.unregister(name)
+            # A registration restored by a rollback is no longer known to
+            # unregister; dropping its catalog view removes it.
+            self.db_connection.execute(
+                f"DROP VIEW IF EXISTS {self._quote_identifier(name)}"
+            )
+        elif kind in ("view", "table"):
+            self.db_connection.execute(
+                f"DROP {kind.upper()} IF EXISTS {self._quote_identifier(name)}"
+            )
+
+    def _create_view(self, name: str, select_sql: str) -> None:
+        """Links a source as a view, or copies it into a table when materializing."""
+        self._release_table_name(name)
+        kind = "table" if self.materialize else "view"
+        self.db_connection.execute(
+            f"CREATE OR REPLACE {kind.upper()} {self._quote_identifier(name)} "
+            f"AS {select_sql}"
+        )
+        self._table_sources[name] = kind
+
+    def _register_table(self, name: str, data: Any) -> None:
+        self._release_table_name(name)
+        if not self.materialize:
+            self.db_connection.register(name, data)
+            self._table_sources[name] = "registered"
             return
-        for table in table_names:
+        staging = f"__sheetql_staging_{name}"
+        self.db_connection.register(staging, data)
+        try:
+            self._create_view(name, f"SELECT * FROM {self._quote_identifier(staging)}")
+        finally:
+            self.db_connection.unregister(staging)
+
+    @staticmethod
+    def _split_source(file_path: str) -> Tuple[str, str]:
+        """Returns the sanitized table-name base and lowercased extension of a file."""
+        stem, ext = os.path.splitext(os.path.basename(file_path))
+        return _SANITIZE_RE.sub("_", stem), ext.lower()
+
+    def _load_excel_extension(self) -> bool:
+        """Loads DuckDB's native Excel reader once per session."""
+        if self._excel_extension_loaded is None:
             try:
-                schema_df = self.db_connection.execute(f"DESCRIBE {table}").fetchdf()
-                self.schema_cache[table] = schema_df["column_name"].tolist()
+                self.db_connection.execute("INSTALL excel; LOAD excel;")
+                self._excel_extension_loaded = True
             except Exception:
+                self.logger.debug("DuckDB excel extension unavailable. Using pandas.")
+                self._excel_extension_loaded = False
+        return self._excel_extension_loaded
+
+    def _link_excel_native(
+        self, file_path: str, base: str, sql_safe_path: str
+    ) -> List[str]:
+        """Exposes each sheet as a view over DuckDB's read_xlsx (no pandas copy)."""
+        generated_tables = []
+        for sheet in self._sheet_titles(file_path):
+            source = (
+                f"read_xlsx('{sql_safe_path}', "
+                f"sheet='{self._escape_sql_path(sheet)}')"
+            )
+            columns = [
+                row[0]
+                for row in self.db_connection.execute(
+                    f"DESCRIBE SELECT * FROM {source}"
+                ).fetchall()
+            ]
+            sub = _SANITIZE_RE.sub
+            clean_columns = [sub("_", str(c).strip()).lower() for c in columns]
+            if clean_columns == columns:
+                projection = "*"
+            else:
+                quote = self._quote_identifier
+                projection = ", ".join(
+                    f"{quote(c)} AS {quote(clean)}"
+                    for c, clean in zip(columns, clean_columns)
+                )
+
+            clean_sheet = _SANITIZE_RE.sub("_", sheet).lower()
+            table_name = f"{base}_{clean_sheet}"
+            self._create_view(table_name, f"SELECT {projection} FROM {source}")
+            generated_tables.append(table_name)
+        return generated_tables
+
+    def _read_excel(self, file_path: str, base: str) -> List[Tuple[str, Any]]:
+        """Reads every sheet into (table_name, data) pairs; touches no DuckDB state."""
+        if CALAMINE_AVAILABLE or file_path.lower().endswith(".xlsx"):
+            try:
+                return self._read_excel_direct(file_path, base)
+            except Exception as e:
+                self.logger.debug(f"Direct sheet read failed for '{file_path}': {e}")
+
+        import pandas as pd
+
+        engine = "calamine" if CALAMINE_AVAILABLE else None
+        try:
+            context = pd.ExcelFile(file_path, engine=engine)
+        except Exception:
+            context = pd.ExcelFile(file_path)
+
+        sheets = []
+        with context as xls:
+            for sheet in xls.sheet_names:
+                data = self._read_sheet_pandas(xls, sheet)
+                if len(data.columns) == 0:
+                    self.logger.debug(f"Skipping empty sheet '{sheet}'")
+                    continue
+                sheets.append((f"{base}_{_SANITIZE_RE.sub('_', sheet).lower()}", data))
+        return sheets
+
+    def _read_excel_direct(self, file_path: str, base: str) -> List[Tuple[str, Any]]:
+        """Reads sheet cell values straight into Arrow, skipping pandas frames."""
+        sheets = []
+        for title, rows in self._iter_sheet_rows(file_path):
+            data: Any = _rows_to_arrow(rows)
+            del rows
+            if data is None:
+                # Mixed-type columns, duplicate headers: let pandas decide.
+                data = self._read_sheet_pandas(file_path, title)
+            if len(data.columns) == 0:
+                # DuckDB cannot register a table without columns.
+                self.logger.debug(f"Skipping empty sheet '{title}'")
+                continue
+            sheets.append((f"{base}_{_SANITIZE_RE.sub('_', title).lower()}", data))
+        return sheets
+
+    @staticmethod
+    def _iter_sheet_rows(file_path: str) -> Iterator[Tuple[str, List[Any]]]:
+        """Yields (sheet title, row values) via calamine, else openpyxl read-only."""
+        if CALAMINE_AVAILABLE:
+            from python_calamine import CalamineWorkbook
+
+            workbook = CalamineWorkbook.from_path(file_path)
+            for title in workbook.sheet_names:
+                sheet = workbook.get_sheet_by_name(title)
+                yield title, sheet.to_python(skip_empty_area=True)
+            return
+
+        from openpyxl import load_workbook
+
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            for ws in wb.worksheets:
+                yield ws.title, list(ws.iter_rows(values_only=True))
+        finally:
+            wb.close()
+
+    @staticmethod
+    def _sheet_titles(file_path: str) -> List[str]:
+        """Lists a workbook's sheet names without reading any cells."""
+        if CALAMINE_AVAILABLE:
+            from python_calamine import CalamineWorkbook
+
+            return list(CalamineWorkbook.from_path(file_path).sheet_names)
+
+        from openpyxl import load_workbook
+
+        wb = load_workbook(file_path, read_only=True)
+        try:
+            return list(wb.sheetnames)
+        finally:
+            wb.close()
+
+    @staticmethod
+    def _read_sheet_pandas(source: Any, sheet: str) -> Any:
+        """Reads one sheet with pandas, handing it over as Arrow when possible."""
+        import pandas as pd
+
+        engine = "calamine" if CALAMINE_AVAILABLE else None
+        if isinstance(source, pd.ExcelFile):
+            df = pd.read_excel(source, sheet_name=sheet)
+        else:
+            df = pd.read_excel(source, sheet_name=sheet, engine=engine)
+        sub = _SANITIZE_RE.sub
+        df.columns = [sub("_", str(c).strip()).lower() for c in df.columns]
+        try:
+            # Arrow buffers are scanned by DuckDB without a column copy.
+            return _arrow_from_pandas(df)
+        except (pa.ArrowException, TypeError, ValueError):
+            return df
+
+    def _load_csv_fallback(self, file_path: str, table_name: str) -> None:
+        """Reads a CSV DuckDB rejected, trying Arrow's parser before pandas."""
+        import pyarrow.csv as pacsv
+
+        data: Any = None
+        try:
+            data = pacsv.read_csv(file_path)
+        except (pa.ArrowInvalid, UnicodeDecodeError) as e:
+            self.logger.debug(f"Arrow CSV reader failed for '{file_path}': {e}")
+        # Arrow keeps undecodable text as binary columns; pandas replaces bad
+        # bytes and skips ragged rows instead.
+        if data is None or any(pa.types.is_binary(f.type) for f in data.schema):
+            import pandas as pd
+
+            data = pd.read_csv(
+                file_path,
+                encoding_errors="replace",
+                on_bad_lines="warn",
+                **self._sniffed_csv_options(file_path),
+            )
+            try:
+                data = _arrow_from_pandas(data)
+            except (pa.ArrowException, TypeError, ValueError):
                 pass
+        self._register_table(table_name, data)
+
+    def _sniffed_csv_options(self, file_path: str) -> Dict[str, Any]:
+        """pandas read_csv options from DuckDB's sniffer (delimiter, text columns)."""
+        try:
+            delimiter, has_header, columns = self.db_connection.execute(
+                "SELECT Delimiter, HasHeader, Columns "
+                "FROM sniff_csv(?, ignore_errors=true)",
+                [file_path],
+            ).fetchone()
+        except duckdb.Error:
+            return {"sep": None, "engine": "python"}
+
+        # Only text columns are pinned: numeric types sniffed while skipping
+        # bad rows may be too narrow, and str accepts any value.
+        options: Dict[str, Any] = {"sep": delimiter}
+        if has_header:
+            options["dtype"] = {
+                c["name"]: str for c in columns if c["type"] == "VARCHAR"
+            }
+        return options
+
+    def _update_schema_cache(self, table_names: List[str]) -> None:
+        if not self.db_connection or not table_names:
+            return
+        placeholders = ", ".join("?" for _ in table_names)
+        try:
+            rows = self.db_connection.execute(
+                "SELECT table_name, column_name, data_type "
+                "FROM information_schema.columns "
+                f"WHERE table_name IN ({placeholders}) "
+                "ORDER BY table_name, ordinal_position",
+                list(table_names),
+            ).fetchall()
+        except Exception:
+            return
+
+        for table in table_names:
+            self.schema_cache.pop(table, None)
+            self.column_types.pop(table, None)
+        for table, column, data_type in rows:
+            self.schema_cache.setdefault(table, []).append(column)
+            self.column_types.setdefault(table, []).append(data_type)
+        self._catalog_changed()
+        if self.completer:
+            self.completer.invalidate()
 
     def _run_interactive_loop(self) -> None:
-        query_buffer = ""
-        completer = (
-            SheetQLCompleter(self.schema_cache) if PROMPT_TOOLKIT_AVAILABLE else None
-        )
-        style = Style.from_dict({"prompt": "ansicyan bold"})
+        # Lines of the statement being typed; joined once, when it is run.
+        query_parts: List[str] = []
+        if PROMPT_TOOLKIT_AVAILABLE and self.session:
+            from prompt_toolkit.lexers import PygmentsLexer
+            from prompt_toolkit.styles import Style
+            from pygments.lexers.sql import SqlLexer
+
+            # Configured once; prompt() reuses the session's completer/lexer/style.
+            self.session.completer = self.completer
+            self.session.lexer = PygmentsLexer(SqlLexer)
+            self.session.style = Style.from_dict({"prompt": "ansicyan bold"})
+        elif READLINE_AVAILABLE:
+            self._init_readline()
 
         while True:
-            prompt_text = self.PROMPT_SQL if not query_buffer else self.PROMPT_CONTINUE
+            prompt_text = self.PROMPT_CONTINUE if query_parts else self.PROMPT_SQL
             try:
                 if PROMPT_TOOLKIT_AVAILABLE and self.session:
-                    line = self.session.prompt(
-                        prompt_text,
-                        completer=completer,
-                        lexer=PygmentsLexer(SqlLexer),
-                        style=style,
-                    )
+                    line = self.session.prompt(prompt_text)
                 else:
-                    line = self.console.input(prompt_text)
+                    line = input(prompt_text)
 
                 if line.strip().startswith("!"):
                     self._handle_history_rerun(line.strip())
-                    query_buffer = ""
+                    query_parts.clear()
                     continue
 
-                query_buffer += line + " "
+                if line.strip() or query_parts:
+                    query_parts.append(line.strip())
             except (KeyboardInterrupt, EOFError):
                 if self._handle_meta_command(".exit"):
                     break
-                query_buffer = ""
+                query_parts.clear()
                 continue
 
             if line.strip().lower().startswith("."):
                 if self._handle_meta_command(line.strip()):
                     break
-                query_buffer = ""
+                query_parts.clear()
                 continue
 
-            if query_buffer.strip().endswith(";"):
-                query_to_run = query_buffer.strip()
-                self.history.append(query_to_run)
+            if line.rstrip().endswith(";"):
+                query_to_run = " ".join(p for p in query_parts if p)
+                if len(query_parts) > 1:
+                    # Multi-line queries are stored line by line; keep the whole
+                    # statement too so it can be recalled and rerun with !N.
+                    self._remember_statement(query_to_run)
                 self._execute_query(query_to_run)
-                query_buffer = ""
+                query_parts.clear()
+
+    def _init_readline(self) -> None:
+        """Line editing and persistent history for the plain input() prompt."""
+        import atexit
+        import readline
+
+        path = os.path.expanduser(self.READLINE_HISTORY_FILE)
+        try:
+            readline.read_history_file(path)
+        except OSError:
+            pass
+        readline.set_history_length(1000)
+
+        def save_history() -> None:
+            try:
+                readline.write_history_file(path)
+            except OSError:
+                pass
+
+        atexit.register(save_history)
+
+    def _remember_statement(self, query: str) -> None:
+        if self.session:
+            self.session.history.append_string(query)
+        elif READLINE_AVAILABLE:
+            import readline
+
+            readline.add_history(query)
 
     def _execute_query(self, query: str) -> None:
         if not self.db_connection:
             return
+        is_select = self._is_select(query)
+        if not is_select:
+            self._catalog_changed()
+        # A SELECT's reader only feeds the preview (staging re-runs it), so it
+        # is read a DuckDB vector at a time; other results may be staged whole.
+        batch_rows = self.PREVIEW_BATCH_ROWS if is_select else self.BATCH_ROWS
+        key = self._query_cache_key(query) if is_select else None
         try:
+            if key is not None and key in self._query_cache:
+                self._query_cache.move_to_end(key)
+                self.logger.info("Query Successful (cached)")
+                self._display_results_table(self._query_cache[key])
+                self._prompt_to_stage_results(self.db_connection.sql(query), query)
+                return
             with self.console.status("[bold green]Executing...[/bold green]"):
-                res = self.db_connection.execute(query).fetchdf()
+                result = self.db_connection.execute(query)
+                # DDL/DML only report a status (rows affected, success flag):
+                # acknowledge it instead of previewing and offering to stage it.
+                if not is_select and self._is_status_result(result):
+                    self.console.print("[green]OK[/green]")
+                    return
+                reader = _fetch_arrow_reader(result, batch_rows)
+                # Only the batches needed for the preview are pulled from DuckDB.
+                head: List[pa.RecordBatch] = []
+                head_rows = 0
+                for batch in reader:
+                    head.append(batch)
+                    head_rows += batch.num_rows
+                    if head_rows > self.PREVIEW_ROWS:
+                        break
 
-            if res.empty:
+            if head_rows == 0:
                 self.console.print("[yellow]No data returned.[/yellow]")
             else:
                 self.logger.info("Query Successful")
-                self._display_results_table(res)
-                self._prompt_to_stage_results(res, query)
+                preview = pa.Table.from_batches(head, schema=reader.schema)
+                self._display_results_table(preview)
+                # SELECTs are staged as relations and re-run at save time;
+                # anything else keeps its result, fetched only if staged.
+                if is_select:
+                    if key is not None:
+                        # One row past the preview keeps the "more rows" marker.
+                        self._query_cache[key] = preview.slice(0, self.PREVIEW_ROWS + 1)
+                        if len(self._query_cache) > self.QUERY_CACHE_SIZE:
+                            self._query_cache.popitem(last=False)
+                    staged = self.db_connection.sql(query)
+                else:
+                    staged = pa.RecordBatchReader.from_batches(
+                        reader.schema, itertools.chain(head, reader)
+                    )
+                self._prompt_to_stage_results(staged, query)
         except Exception as e:
             self.logger.error(f"SQL Error: {e}")
 
-    def _display_results_table(self, df: pd.DataFrame) -> None:
+    def _query_cache_key(self, query: str) -> Optional[str]:
+        """Preview-cache key for a SELECT, or None when it must always re-run.
+
+        Views re-read their files on every query, so each loaded file is
+        re-stat'ed: rewriting one changes the key and misses the cache.
+        """
+        words = set(re.findall(r"[a-z_][a-z0-9_]*", query.lower()))
+        if not words.isdisjoint(self._volatile_function_names()):
+            return None
+        digest = hashlib.blake2b(query.strip().rstrip(";").encode(), digest_size=16)
+        for path in sorted(self._file_fingerprints):
+            digest.update(f"\0{path}\0{self._fingerprint(path)}".encode())
+        return digest.hexdigest()
+
+    def _volatile_function_names(self) -> FrozenSet[str]:
+        """Functions whose result can differ between runs of the same query."""
+        if self._volatile_functions is None:
+            names = set(self.VOLATILE_SQL_WORDS)
+            try:
+                rows = self.db_connection.execute(
+                    "SELECT DISTINCT function_name FROM duckdb_functions() "
+                    "WHERE stability IS NOT NULL AND stability <> 'CONSISTENT'"
+                ).fetchall()
+                names.update(name.lower() for (name,) in rows)
+            except duckdb.Error as e:
+                self.logger.debug(f"Function stability unavailable: {e}")
+            self._volatile_functions = frozenset(names)
+        return self._volatile_functions
+
+    @staticmethod
+    def _is_status_result(result: duckdb.DuckDBPyConnection) -> bool:
+        """True when a statement's result is only DuckDB's Count/Success column."""
+        description = result.description or []
+        return len(description) <= 1 and all(
+            col[0] in ("Count", "Success") for col in description
+        )
+
+    @staticmethod
+    def _is_select(query: str) -> bool:
+        """True when the query is a single read-only SELECT statement."""
+        try:
+            statements = duckdb.extract_statements(query)
+        except (duckdb.Error, AttributeError):
+            # AttributeError: DuckDB builds without extract_statements.
+            return False
+        return (
+            len(statements) == 1 and statements[0].type == duckdb.StatementType.SELECT
+        )
+
+    def _lazy_relation(self, query: str) -> Optional[duckdb.DuckDBPyRelation]:
+        """Returns an unexecuted relation for a single SELECT statement."""
+        return self.db_connection.sql(query) if self._is_select(query) else None
+
+    def _display_results_table(self, results: pa.Table) -> None:
         table = Table(show_header=True, header_style="bold magenta")
-        for col in df.columns:
+        for col in results.column_names:
             table.add_column(str(col))
-        for _, row in df.head(15).iterrows():
-            table.add_row(*[str(x) for x in row])
+        # Cells are stringified a column at a time: numeric/bool columns with a
+        # plain numpy form are formatted by numpy, everything else from Arrow's
+        # Python values (no pandas; nulls print as None, lists as lists).
+        columns = []
+        for col in results.slice(0, self.PREVIEW_ROWS).columns:
+            if col.null_count == 0 and (
+                pa.types.is_integer(col.type)
+                or pa.types.is_floating(col.type)
+                or pa.types.is_boolean(col.type)
+            ):
+                columns.append(col.to_numpy().astype(str))
+            else:
+                columns.append(list(map(str, col.to_pylist())))
+        for row in zip(*columns):
+            table.add_row(*row)
         self.console.print(table)
-        if len(df) > 15:
-            self.console.print(f"... ({len(df)-15} more rows)")
+        if results.num_rows > self.PREVIEW_ROWS:
+            # Results are streamed, not read to the end, so nothing is counted.
+            self.console.print("... (more rows, not counted)")
 
-    def _prompt_to_stage_results(self, results: pd.DataFrame, query: str) -> None:
+    def _prompt_to_stage_results(
+        self, results: Union[StagedResult, pa.RecordBatchReader], query: str
+    ) -> None:
         if self.console.input("\nStage for export? (y/n): ").lower().startswith("y"):
             name = self.console.input("Sheet name: ")
             if name:
+                if isinstance(results, pa.RecordBatchReader):
+                    results = results.read_all()
                 self.results_to_save[name] = results
                 self.recorder.record_query(name, query)
                 self.logger.info(f"Staged '{name}'")
 
+    def _save_results(self, save_path: str) -> None:
+        """Routes staged results to a writer based on the target extension."""
+        ext = os.path.splitext(save_path)[1].lower()
+        if ext == ".parquet":
+            self._save_to_parquet(save_path)
+        elif ext in [".arrow", ".feather"]:
+            self._save_to_arrow(save_path)
+        else:
+            oversized = []
+            for name, results in self.results_to_save.items():
+                # Staged SELECTs re-run here; their tables may since have been
+                # renamed, dropped or reloaded.
+                try:
+                    rows = self._row_count(results)
+                except duckdb.Error as e:
+                    self.logger.error(f"Save failed: '{name}' can no longer run: {e}")
+                    return
+                if rows > self.EXCEL_MAX_ROWS:
+                    oversized.append(name)
+            if oversized:
+                parquet_path = os.path.splitext(save_path)[0] + ".parquet"
+                self.logger.warning(
+                    f"{', '.join(oversized)} exceed Excel's row limit. "
+                    f"Writing Parquet to '{parquet_path}' instead."
+                )
+                self._save_to_parquet(parquet_path)
+            else:
+                self._save_to_excel(save_path)
+
+    @staticmethod
+    def _row_count(results: StagedResult) -> int:
+        if isinstance(results, duckdb.DuckDBPyRelation):
+            return results.aggregate("count(*)").fetchone()[0]
+        return len(results)
+
+    def _staged_reader(self, results: StagedResult) -> pa.RecordBatchReader:
+        """Streams a staged result as Arrow batches, running relations on demand."""
+        if isinstance(results, duckdb.DuckDBPyRelation):
+            return _fetch_arrow_reader(results, self.BATCH_ROWS)
+        if not isinstance(results, pa.Table):  # A DataFrame staged directly.
+            results = pa.Table.from_pandas(results, preserve_index=False)
+        return pa.RecordBatchReader.from_batches(
+            results.schema, results.to_batches(max_chunksize=self.BATCH_ROWS)
+        )
+
+    def _export_targets(self, save_path: str) -> Dict[str, str]:
+        """Maps staged sheets to output files: one file, or one per sheet."""
+        if len(self.results_to_save) == 1:
+            return {name: save_path for name in self.results_to_save}
+        stem, ext = os.path.splitext(save_path)
+        return {
+            name: f"{stem}_{_SANITIZE_RE.sub('_', name)}{ext}"
+            for name in self.results_to_save
+        }
+
+    def _save_to_parquet(self, save_path: str) -> None:
+        """Streams staged results to Parquet through DuckDB's writer."""
+        try:
+            with self.console.status("[bold green]Saving Parquet...[/bold green]"):
+                for name, target in self._export_targets(save_path).items():
+                    results = self.results_to_save[name]
+                    if not isinstance(results, duckdb.DuckDBPyRelation):
+                        results = self.db_connection.from_arrow(
+                            self._staged_reader(results)
+                        )
+                    results.write_parquet(target, compression="zstd")
+
+            self.logger.info(f"Saved to '{os.path.basename(save_path)}' (parquet)")
+            self.recorder.record_export(save_path)
+            self.results_to_save.clear()
+        except Exception as e:
+            self.logger.error(f"Save failed: {e}")
+
+    def _save_to_arrow(self, save_path: str) -> None:
+        """Writes staged results as Arrow IPC (Feather v2) files."""
+        import pyarrow.feather as feather
+
+        try:
+            with self.console.status("[bold green]Saving Arrow...[/bold green]"):
+                for name, target in self._export_targets(save_path).items():
+                    feather.write_feather(
+                        self._staged_reader(self.results_to_save[name]).read_all(),
+                        target,
+                    )
+
+            self.logger.info(f"Saved to '{os.path.basename(save_path)}' (arrow)")
+            self.recorder.record_export(save_path)
+            self.results_to_save.clear()
+        except Exception as e:
+            self.logger.error(f"Save failed: {e}")
+
     def _save_to_excel(self, save_path: str) -> None:
         try:
             with self.console.status("[bold green]Saving Excel file...[/bold green]"):
                 engine = "xlsxwriter" if XLSXWRITER_AVAILABLE else "openpyxl"
-                with pd.ExcelWriter(save_path, engine=engine) as writer:
-                    for sheet_name, df in self.results_to_save.items():
-                        df.to_excel(writer, sheet_name=sheet_name, index=False)
+                if engine == "xlsxwriter":
+                    self._write_xlsx_streaming(save_path)
+                elif self._copy_xlsx_native(save_path):
+                    engine = "duckdb"
+                else:
+                    import pandas as pd
+                    from openpyxl.styles import Font, PatternFill
+                    from openpyxl.utils import get_column_letter
 
-                        if engine == "xlsxwriter":
-                            wb = writer.book
-                            ws = writer.sheets[sheet_name]
-                            header_fmt = wb.add_format(
-                                {
-                                    "bold": True,
-                                    "fg_color": "#4F81BD",
-                                    "font_color": "white",
-                                }
-                            )
-                            for col_num, value in enumerate(df.columns.values):
-                                ws.write(0, col_num, value, header_fmt)
-                            for i, col in enumerate(df.columns):
-                                ws.set_column(i, i, 20)
-                        else:
-                            header_font = Font(bold=True, color="FFFFFF")
-                            fill = PatternFill(
-                                start_color="4F81BD",
-                                end_color="4F81BD",
-                                fill_type="solid",
+                    header_font = Font(bold=True, color="FFFFFF")
+                    fill = PatternFill(
+                        start_color="4F81BD", end_color="4F81BD", fill_type="solid"
+                    )
+                    with pd.ExcelWriter(save_path, engine=engine) as writer:
+                        for sheet_name, results in self.results_to_save.items():
+                            table = self._staged_reader(results).read_all()
+                            table.to_pandas().to_excel(
+                                writer, sheet_name=sheet_name, index=False
                             )
-                            for ws in writer.book.worksheets:
-                                for cell in ws[1]:
-                                    cell.font = header_font
-                                    cell.fill = fill
-                                ws.auto_filter.ref = ws.dimensions
+                            ws = writer.sheets[sheet_name]
+                            columns = zip(table.column_names, table.columns)
+                            for i, (name, col) in enumerate(columns, 1):
+                                width = max(len(name), _text_width(col)) + 2
+                                ws.column_dimensions[get_column_letter(i)].width = min(
+                                    width, self.MAX_COLUMN_WIDTH
+                                )
+
+                            # Style only this sheet's header row.
+                            for cell in ws[1]:
+                                cell.font = header_font
+                                cell.fill = fill
+                            ws.auto_filter.ref = ws.dimensions
 
             self.logger.info(f"Saved to '{os.path.basename(save_path)}' ({engine})")
             self.recorder.record_export(save_path)
@@ -546,29 +1463,95 @@ class SheetQL:
         except Exception as e:
             self.logger.error(f"Save failed: {e}")
 
+    def _copy_xlsx_native(self, save_path: str) -> bool:
+        """COPYs a single staged result to .xlsx with DuckDB's excel extension.
+
+        Used when xlsxwriter is missing: the workbook is written by DuckDB
+        without a pandas round trip, but unstyled and limited to one sheet.
+        """
+        if len(self.results_to_save) != 1 or not self._load_excel_extension():
+            return False
+        ((name, results),) = self.results_to_save.items()
+        staging = None
+        if isinstance(results, duckdb.DuckDBPyRelation):
+            source = f"({results.sql_query()})"
+        else:
+            staging = "__sheetql_export"
+            self.db_connection.register(staging, results)
+            source = self._quote_identifier(staging)
+        try:
+            self.db_connection.execute(
+                f"COPY (SELECT * FROM {source}) "
+                f"TO '{self._escape_sql_path(save_path)}' "
+                f"(FORMAT xlsx, SHEET '{self._escape_sql_path(name)}', HEADER true)"
+            )
+            return True
+        except duckdb.Error as e:
+            self.logger.debug(f"DuckDB xlsx export failed: {e}")
+            return False
+        finally:
+            if staging:
+                self.db_connection.unregister(staging)
+
+    def _write_xlsx_streaming(self, save_path: str) -> None:
+        """Writes staged results row-by-row with xlsxwriter's constant-memory mode."""
+        import xlsxwriter
+
+        wb = xlsxwriter.Workbook(
+            save_path,
+            {
+                "constant_memory": True,
+                "use_zip64": True,
+                "nan_inf_to_errors": True,
+                "remove_timezone": True,
+                "default_date_format": "yyyy-mm-dd hh:mm:ss",
+            },
+        )
+        header_fmt = wb.add_format(
+            {"bold": True, "fg_color": "#4F81BD", "font_color": "white"}
+        )
+        for sheet_name, results in self.results_to_save.items():
+            ws = wb.add_worksheet(sheet_name)
+            for nested_type in (list, tuple, dict, bytes):
+                ws.add_write_handler(nested_type, _write_as_text)
+            ws.add_write_handler(pa.MonthDayNano, _write_interval)
+
+            reader = self._staged_reader(results)
+            names = reader.schema.names
+            ws.write_row(0, 0, [str(c) for c in names], header_fmt)
+
+            # Arrow columns convert straight to Python values (nulls -> None).
+            widths = [len(str(c)) for c in names]
+            r = 1
+            for batch in reader:
+                widths = [
+                    max(w, _text_width(col)) for w, col in zip(widths, batch.columns)
+                ]
+                for row in zip(*(col.to_pylist() for col in batch.columns)):
+                    ws.write_row(r, 0, row)
+                    r += 1
+
+            # Column settings are kept until close, so they can follow rows.
+            for i, width in enumerate(widths):
+                ws.set_column(i, i, min(width + 2, self.MAX_COLUMN_WIDTH))
+            if names:
+                ws.autofilter(0, 0, r - 1, len(names) - 1)
+        # Rows sit in temp files until close() assembles the .xlsx; an error
+        # above skips it, so no half-written workbook is left on disk.
+        wb.close()
+
     def _handle_meta_command(self, command_str: str) -> bool:
         parts = command_str.split()
         cmd = parts[0].lower()
 
-        commands = {
-            ".exit": lambda: True,
-            ".quit": lambda: True,
-            ".help": self._show_help,
-            ".tables": self._list_tables,
-            ".schema": lambda: self._describe_table(parts),
-            ".history": self._show_history,
-            ".load": self._add_new_files,
-            ".export": self._export_results,
-            ".dump": lambda: self._dump_script(parts),
-            ".runscript": lambda: self._run_script_interactive(parts),
-            ".rename": lambda: self._rename_table(parts),
-        }
-
-        if cmd not in commands:
+        handler = self.META_COMMANDS.get(cmd)
+        if handler is None:
             self.logger.warning(f"Unknown command: {cmd}")
             return False
 
-        should_exit = commands[cmd]()
+        method_name, takes_args = handler
+        method = getattr(self, method_name)
+        should_exit = method(parts) if takes_args else method()
         if should_exit and cmd in [".exit", ".quit"] and self.results_to_save:
             if (
                 self.console.input("Export staged results? (y/n): ")
@@ -578,6 +1561,10 @@ class SheetQL:
                 self._export_results()
         return should_exit
 
+    @staticmethod
+    def _request_exit() -> bool:
+        return True
+
     def _dump_script(self, parts: List[str]) -> None:
         filename = parts[1] if len(parts) > 1 else "script.yaml"
         try:
@@ -600,25 +1587,63 @@ class SheetQL:
             "  [bold yellow].runscript <file>[/bold yellow] Run a YAML script"
         )
 
+    def _current_tables(self) -> List[str]:
+        """SHOW TABLES, cached until the catalog changes."""
+        if self._table_names is None:
+            self._table_names = [
+                row[0] for row in self.db_connection.execute("SHOW TABLES").fetchall()
+            ]
+        return self._table_names
+
     def _list_tables(self) -> None:
         if self.db_connection:
             try:
-                tables = self.db_connection.execute("SHOW TABLES").fetchdf()["name"]
+                tables = self._current_tables()
                 self.console.print(f"\n[cyan]Tables ({len(tables)}):[/cyan]")
                 for t in tables:
                     self.console.print(f" - {t}")
             except Exception:
                 pass
 
+    def _schema_key(self, name: str) -> str:
+        """Resolves a table name to its schema_cache key, ignoring case."""
+        if name in self.schema_cache:
+            return name
+        return next((k for k in self.schema_cache if k.lower() == name.lower()), name)
+
+    def _catalog_changed(self) -> None:
+        """Drops lookups that depend on which tables exist or what they hold."""
+        self._table_names = None
+        self._query_cache.clear()
+
+    def _move_schema_entry(self, old: str, new: str) -> None:
+        """Re-keys cached columns/types after a table is renamed."""
+        self._catalog_changed()
+        actual_key = self._schema_key(old)
+        if actual_key in self._table_sources:
+            self._table_sources[new] = self._table_sources.pop(actual_key)
+        if actual_key in self.schema_cache:
+            self.schema_cache[new] = self.schema_cache.pop(actual_key)
+            if actual_key in self.column_types:
+                self.column_types[new] = self.column_types.pop(actual_key)
+            if self.completer:
+                self.completer.invalidate()
+
     def _describe_table(self, parts: List[str]) -> None:
         if len(parts) == 2 and self.db_connection:
             try:
-                df = self.db_connection.execute(f"DESCRIBE {parts[1]}").fetchdf()
+                key = self._schema_key(parts[1])
+                if key in self.column_types:
+                    rows = zip(self.schema_cache[key], self.column_types[key])
+                else:
+                    rows = self.db_connection.execute(
+                        f"DESCRIBE {self._quote_identifier(parts[1])}"
+                    ).fetchall()
                 t = Table(title=f"Schema: {parts[1]}")
-                for c in df.columns:
-                    t.add_column(c)
-                for _, r in df.iterrows():
-                    t.add_row(*[str(x) for x in r])
+                t.add_column("column_name")
+                t.add_column("column_type")
+                for r in rows:
+                    t.add_row(str(r[0]), str(r[1]))
                 self.console.print(t)
             except Exception as e:
                 self.logger.error(str(e))
@@ -628,26 +1653,51 @@ class SheetQL:
             try:
                 old = parts[1]
                 new = parts[2]
-                self.db_connection.execute(f'ALTER VIEW "{old}" RENAME TO "{new}"')
+                self.db_connection.execute(self._rename_sql(old, new))
                 self.logger.info(f"Renamed {old} -> {new}")
 
-                actual_key = next(
-                    (k for k in self.schema_cache if k.lower() == old.lower()), old
-                )
-                if actual_key in self.schema_cache:
-                    self.schema_cache[new] = self.schema_cache.pop(actual_key)
+                self._move_schema_entry(old, new)
             except Exception as e:
                 self.logger.error(str(e))
 
+    def _rename_sql(self, old: str, new: str) -> str:
+        """ALTER statement renaming a loaded view or materialized table."""
+        kind = self._table_sources.get(self._schema_key(old))
+        return (
+            f"ALTER {'TABLE' if kind == 'table' else 'VIEW'} "
+            f"{self._quote_identifier(old)} RENAME TO {self._quote_identifier(new)}"
+        )
+
+    def _history_entries(self) -> List[str]:
+        """Returns the most recent complete SQL statements from the prompt history."""
+        if self.session:
+            entries = self.session.history.get_strings()
+        elif READLINE_AVAILABLE:
+            import readline
+
+            entries = [
+                readline.get_history_item(i)
+                for i in range(1, readline.get_current_history_length() + 1)
+            ]
+        else:
+            return []
+        statements = [
+            entry.strip()
+            for entry in entries
+            if entry.strip().endswith(";") and not entry.lstrip().startswith((".", "!"))
+        ]
+        return statements[-self.HISTORY_MAX_LEN :]
+
     def _show_history(self) -> None:
-        for i, c in enumerate(self.history, 1):
+        for i, c in enumerate(self._history_entries(), 1):
             self.console.print(f"{i}: {c}")
 
     def _handle_history_rerun(self, cmd: str) -> None:
         try:
             idx = int(cmd[1:])
-            if 1 <= idx <= len(self.history):
-                self._execute_query(self.history[idx - 1])
+            history = self._history_entries()
+            if 1 <= idx <= len(history):
+                self._execute_query(history[idx - 1])
         except Exception:
             pass
 
@@ -662,7 +1712,7 @@ class SheetQL:
             return
 
         if path := self._prompt_for_save_path():
-            self._save_to_excel(path)
+            self._save_results(path)
 
     def _run_script_interactive(self, parts: List[str]) -> None:
         script_path = parts[1] if len(parts) > 1 else None
@@ -674,69 +1724,95 @@ class SheetQL:
             return
 
         try:
-            with open(script_path, "r") as f:
-                config = yaml.safe_load(f)
-            self._execute_yaml_script(config)
+            self._execute_yaml_script(self._read_yaml(script_path))
         except Exception as e:
             self.logger.error(f"Script Error: {e}")
 
+    def _apply_aliases(self, renames: List[Tuple[str, str]]) -> None:
+        """Renames loaded tables in one transaction and moves their cache entries."""
+        if not renames:
+            return
+        try:
+            self.db_connection.begin()
+            for old, new in renames:
+                self.db_connection.execute(self._rename_sql(old, new))
+            self.db_connection.commit()
+        except Exception as e:
+            self.db_connection.rollback()
+            self.logger.error(f"Aliasing failed: {e}")
+            return
+
+        for old, new in renames:
+            self._move_schema_entry(old, new)
+            self.logger.info(f"Aliased {old} -> {new}")
+
     def _execute_yaml_script(self, config: Dict[str, Any]) -> None:
         """Executes operations from YAML config using the file-map for robust aliasing."""
         if "inputs" in config:
             paths = [i["path"] for i in config["inputs"]]
             self._load_data(paths)
 
+            tables_by_path: Dict[str, List[str]] = {}
+            tables_by_name: Dict[str, List[str]] = {}
+            for loaded_path, tables in self.loaded_files_map.items():
+                tables_by_path[os.path.normpath(loaded_path)] = tables
+                tables_by_name.setdefault(os.path.basename(loaded_path), tables)
+
+            renames: List[Tuple[str, str]] = []
             for item in config["inputs"]:
                 path = item["path"]
                 alias = item.get("alias")
                 if not alias:
                     continue
 
-                found_tables = []
-                for loaded_path, tables in self.loaded_files_map.items():
-                    if os.path.normpath(loaded_path) == os.path.normpath(
-                        path
-                    ) or os.path.basename(loaded_path) == os.path.basename(path):
-                        found_tables = tables
-                        break
+                found_tables = tables_by_path.get(
+                    os.path.normpath(path)
+                ) or tables_by_name.get(os.path.basename(path), [])
 
-                if found_tables:
-                    if len(found_tables) == 1:
-                        self.db_connection.execute(
-                            f'ALTER VIEW "{found_tables[0]}" RENAME TO "{alias}"'
-                        )
-                        self.logger.info(f"Aliased {found_tables[0]} -> {alias}")
-                    else:
-                        for tbl in found_tables:
-                            suffix = tbl.split("_", 1)[-1] if "_" in tbl else "sheet"
-                            new_name = f"{alias}_{suffix}"
-                            self.db_connection.execute(
-                                f'ALTER VIEW "{tbl}" RENAME TO "{new_name}"'
-                            )
-                            self.logger.info(f"Aliased {tbl} -> {new_name}")
+                if len(found_tables) == 1:
+                    renames.append((found_tables[0], alias))
+                else:
+                    # Sheet tables are named "<base>_<sheet>"; keep the sheet part.
+                    prefix = f"{self._split_source(path)[0]}_"
+                    for tbl in found_tables:
+                        suffix = tbl[len(prefix) :] if tbl.startswith(prefix) else tbl
+                        renames.append((tbl, f"{alias}_{suffix}"))
+
+            self._apply_aliases(renames)
 
         if "tasks" in config:
             for task in config.get("tasks", []):
                 try:
-                    self.results_to_save[task["name"]] = self.db_connection.execute(
-                        task["sql"]
-                    ).fetchdf()
+                    staged = self._lazy_relation(task["sql"])
+                    if staged is None:
+                        self._catalog_changed()
+                        staged = _fetch_arrow_table(
+                            self.db_connection.execute(task["sql"])
+                        )
+                    self.results_to_save[task["name"]] = staged
                     self.logger.info(f"Task '{task['name']}' complete.")
                 except Exception as e:
                     self.logger.error(f"Task '{task['name']}' failed: {e}")
 
         if "export" in config:
-            self._save_to_excel(config["export"]["path"])
+            self._save_results(config["export"]["path"])
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="SheetQL Professional")
     parser.add_argument("-r", "--run", dest="config_path", help="Run batch config")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    parser.add_argument(
+        "--materialize",
+        action="store_true",
+        help="Copy loaded files into DuckDB tables (faster repeated queries)",
+    )
+    parser.add_argument("--gui", action="store_true", help="Pick files with Tk dialogs")
     args = parser.parse_args()
 
     logger = setup_logging(args.debug)
-    tool = SheetQL(logger)
+    setup_arrow_memory_pool(logger)
+    tool = SheetQL(logger, materialize=args.materialize, gui=args.gui)
 
     if args.config_path:
         tool.run_batch(args.config_path)
@@ -1,14 +1,26 @@
 import unittest
+import io
 import os
 import sys
 import shutil
+import tempfile
 import logging
+import duckdb
+import openpyxl
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import yaml
 from unittest.mock import patch, MagicMock
+from rich.console import Console
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from sheet_ql import SheetQL
+from sheet_ql import (
+    PROMPT_TOOLKIT_AVAILABLE,
+    SheetQL,
+    _fetch_arrow_table,
+    _split_path_list,
+)
 
 
 class TestSheetQL(unittest.TestCase):
@@ -17,43 +29,68 @@ class TestSheetQL(unittest.TestCase):
     Session Recording, and CLI meta-commands.
     """
 
-    def setUp(self):
-        """Initializes the test environment with sandbox directory and dummy files."""
-        self.test_dir = "test_env_sandbox"
-        os.makedirs(self.test_dir, exist_ok=True)
-
-        self.csv_path = os.path.join(self.test_dir, "sales_2023.csv")
-        pd.DataFrame(
-            {
-                "id": [1, 2, 3],
-                "sales_rep": ["Alice", "Bob", "Charlie"],
-                "amount": [100, 200, 150],
-            }
-        ).to_csv(self.csv_path, index=False)
-
-        self.excel_path = os.path.join(self.test_dir, "targets.xlsx")
-        with pd.ExcelWriter(self.excel_path) as writer:
+    @classmethod
+    def setUpClass(cls):
+        """Creates the sandbox directory and the read-only sample files once."""
+        # RAM-backed where available; TemporaryDirectory handles removal
+        shm = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        cls._tmp = tempfile.TemporaryDirectory(prefix="sheetql_", dir=shm)
+        cls.test_dir = cls._tmp.name
+
+        cls.csv_path = os.path.join(cls.test_dir, "sales_2023.csv")
+        pacsv.write_csv(
+            pa.table(
+                {
+                    "id": [1, 2, 3],
+                    "sales_rep": ["Alice", "Bob", "Charlie"],
+                    "amount": [100, 200, 150],
+                }
+            ),
+            cls.csv_path,
+        )
+
+        cls.excel_path = os.path.join(cls.test_dir, "targets.xlsx")
+        with pd.ExcelWriter(cls.excel_path) as writer:
             pd.DataFrame({"city": ["NY", "LA"], "target": [1000, 500]}).to_excel(
                 writer, sheet_name="Q1_Targets", index=False
             )
 
+        # One configured connection is shared; setUp empties it between tests.
+        bootstrap = SheetQL(logging.getLogger("TestLogger"))
+        bootstrap._init_db()
+        cls.db_connection = bootstrap.db_connection
+
+    @classmethod
+    def tearDownClass(cls):
+        """Closes the shared connection and removes the sandbox directory."""
+        # Close first to release locks on CSV/Parquet files
+        try:
+            cls.db_connection.close()
+        except Exception:
+            pass
+
+        cls._tmp.cleanup()
+
+    def setUp(self):
+        """Creates a fresh SheetQL instance for each test."""
         # Initialize with a dummy logger to suppress console output during tests
         self.test_logger = logging.getLogger("TestLogger")
         self.test_logger.setLevel(logging.CRITICAL)
 
         self.tool = SheetQL(self.test_logger)
-        self.tool._init_db()
+        # A real console on a buffer: quiet, and rich still sees a plain file.
+        self.tool.console = Console(file=io.StringIO())
+        self.tool.console.input = MagicMock(return_value="n")
+        self.tool.db_connection = self.db_connection
+        self._reset_db()
 
     def tearDown(self):
         """
-        Aggressively cleans up resources to prevent file lock issues on Windows.
+        Resets the shared catalog and releases per-test resources.
         """
-        # 1. Close Database Connection (Releases locks on CSV/Parquet files)
-        if self.tool.db_connection:
-            try:
-                self.tool.db_connection.close()
-            except Exception:
-                pass
+        # 1. Drop this test's tables/views (file locks are released when the
+        #    shared connection closes in tearDownClass)
+        self._reset_db()
 
         # 2. Close Logger Handlers (Releases locks on log files)
         if hasattr(self.tool, "logger"):
@@ -63,18 +100,20 @@ class TestSheetQL(unittest.TestCase):
                 except Exception:
                     pass
 
-        # 3. Remove Sandbox Directory (With retry logic for lingering locks)
-        if os.path.exists(self.test_dir):
-
-            def on_rm_error(func, path, exc_info):
-                # Attempt to change permission and retry
-                try:
-                    os.chmod(path, 0o777)
-                    func(path)
-                except Exception:
-                    pass
-
-            shutil.rmtree(self.test_dir, onerror=on_rm_error)
+    def _reset_db(self):
+        """Drops every table and view left on the shared connection."""
+        con = self.db_connection
+        objects = con.execute(
+            "SELECT table_name, table_type FROM information_schema.tables"
+        ).fetchall()
+        for name, kind in objects:
+            kind = "TABLE" if kind == "BASE TABLE" else "VIEW"
+            con.execute(f'DROP {kind} IF EXISTS "{name}" CASCADE')
+
+    def _table_names(self):
+        """Returns the names listed by SHOW TABLES without building a DataFrame."""
+        rows = self.db_connection.execute("SHOW TABLES").fetchall()
+        return [row[0] for row in rows]
 
     def test_01_zero_copy_loading(self):
         """Verifies that files are correctly registered as DuckDB views."""
@@ -83,9 +122,7 @@ class TestSheetQL(unittest.TestCase):
         self.assertIn("sales_2023_csv", loaded)
         self.assertIn("targets_q1_targets", loaded)
 
-        tables = (
-            self.tool.db_connection.execute("SHOW TABLES").fetchdf()["name"].tolist()
-        )
+        tables = self._table_names()
         self.assertIn("sales_2023_csv", tables)
         self.assertIn("targets_q1_targets", tables)
 
@@ -104,14 +141,11 @@ class TestSheetQL(unittest.TestCase):
         """Verifies SQL execution logic and data retrieval."""
         self.tool._load_data([self.csv_path])
 
-        # Suppress UI interactions
-        self.tool.console = MagicMock()
-
         query = "SELECT sales_rep FROM sales_2023_csv WHERE amount > 150"
         self.tool._execute_query(query)
 
-        res = self.tool.db_connection.execute(query).fetchdf()
-        self.assertEqual(res.iloc[0]["sales_rep"], "Bob")
+        res = self.tool.db_connection.execute(query).fetchall()
+        self.assertEqual(res[0][0], "Bob")
 
     def test_04_session_recorder(self):
         """Verifies that loading and querying actions are recorded."""
@@ -146,10 +180,10 @@ class TestSheetQL(unittest.TestCase):
 
         self.tool._execute_yaml_script(config)
 
-        tables = (
-            self.tool.db_connection.execute("SHOW TABLES").fetchdf()["name"].tolist()
-        )
+        tables = self._table_names()
         self.assertIn("revenue_data", tables)
+        self.assertIn("revenue_data", self.tool.schema_cache)
+        self.assertNotIn("sales_2023_csv", self.tool.schema_cache)
 
     @patch("sheet_ql.SheetQL._export_results")
     def test_07_exit_with_staging_prompt(self, mock_export):
@@ -167,14 +201,374 @@ class TestSheetQL(unittest.TestCase):
         self.tool._load_data([self.csv_path])
         self.tool._handle_meta_command(".rename sales_2023_csv old_sales")
 
-        tables = (
-            self.tool.db_connection.execute("SHOW TABLES").fetchdf()["name"].tolist()
-        )
+        tables = self._table_names()
         self.assertIn("old_sales", tables)
         self.assertNotIn("sales_2023_csv", tables)
 
         self.assertIn("old_sales", self.tool.schema_cache)
 
+    def test_09_excel_mixed_type_sheet(self):
+        """Verifies mixed-type sheet columns are loaded as text through Arrow."""
+        mixed_path = os.path.join(self.test_dir, "mixed.xlsx")
+        pd.DataFrame({"code": [1, "A2", 3.5]}).to_excel(
+            mixed_path, sheet_name="Codes", index=False
+        )
+
+        loaded = self.tool._load_data([mixed_path])
+        self.assertIn("mixed_codes", loaded)
+
+        rows = self.tool.db_connection.execute(
+            "SELECT code FROM mixed_codes"
+        ).fetchall()
+        self.assertEqual(rows, [("1",), ("A2",), ("3.5",)])
+        self.assertEqual(self.tool.column_types["mixed_codes"], ["VARCHAR"])
+
+    def test_10_excel_export_roundtrip(self):
+        """Verifies staged results are written to Excel with nulls and nested values."""
+        self.tool._load_data([self.csv_path])
+        self.tool.console.input = MagicMock(side_effect=["y", "summary"])
+        self.tool._execute_query(
+            "SELECT sales_rep, amount, NULL AS note, [id, amount] AS pair "
+            "FROM sales_2023_csv ORDER BY id"
+        )
+        # SELECTs are staged unexecuted and only run when saved.
+        self.assertIsInstance(
+            self.tool.results_to_save["summary"], duckdb.DuckDBPyRelation
+        )
+
+        save_path = os.path.join(self.test_dir, "report.xlsx")
+        self.tool._save_to_excel(save_path)
+
+        sheet = openpyxl.load_workbook(save_path)["summary"]
+        self.assertEqual(sheet.auto_filter.ref, "A1:D4")
+        self.assertTrue(sheet["A1"].font.b)
+
+        saved = pd.read_excel(save_path, sheet_name="summary")
+        self.assertEqual(saved["sales_rep"].tolist(), ["Alice", "Bob", "Charlie"])
+        self.assertTrue(saved["note"].isna().all())
+        self.assertIn("100", saved["pair"].iloc[0])
+        self.assertEqual(self.tool.results_to_save, {})
+
+    @unittest.skipUnless(PROMPT_TOOLKIT_AVAILABLE, "prompt_toolkit not installed")
+    def test_11_completer_tracks_schema_changes(self):
+        """Verifies cached completions follow loads and renames."""
+        from prompt_toolkit.document import Document
+
+        def complete(text):
+            return [
+                c.text
+                for c in self.tool.completer.get_completions(Document(text), None)
+            ]
+
+        self.tool._load_data([self.csv_path])
+        self.assertEqual(complete("SELECT * FROM sa"), ["sales_2023_csv"])
+        self.assertIn("sales_rep", complete("SELECT sa"))
+        self.assertEqual(complete(".schema sa"), ["sales_2023_csv"])
+        self.assertEqual(complete("SELECT "), [])
+
+        self.tool._handle_meta_command(".rename sales_2023_csv sales")
+        self.assertEqual(complete("SELECT * FROM sa"), ["sales"])
+
+    def test_12_parquet_export_per_sheet(self):
+        """Verifies .parquet targets are written by DuckDB, one file per sheet."""
+        self.tool._load_data([self.csv_path])
+        con = self.tool.db_connection
+        self.tool.results_to_save["big"] = _fetch_arrow_table(
+            con.execute("SELECT * FROM sales_2023_csv WHERE amount > 120")
+        )
+        self.tool.results_to_save["all"] = _fetch_arrow_table(
+            con.execute("SELECT * FROM sales_2023_csv")
+        )
+
+        self.tool._save_results(os.path.join(self.test_dir, "out.parquet"))
+
+        big = pd.read_parquet(os.path.join(self.test_dir, "out_big.parquet"))
+        full = pd.read_parquet(os.path.join(self.test_dir, "out_all.parquet"))
+        self.assertEqual(len(big), 2)
+        self.assertEqual(len(full), 3)
+        self.assertEqual(self.tool.results_to_save, {})
+
+    @unittest.skipUnless(PROMPT_TOOLKIT_AVAILABLE, "prompt_toolkit not installed")
+    def test_13_history_rerun_uses_prompt_history(self):
+        """Verifies !N indexes complete SQL statements from the prompt history."""
+        from prompt_toolkit.history import InMemoryHistory
+
+        self.tool.session.history = InMemoryHistory()
+        for entry in ["SELECT 1;", ".tables", "SELECT *", "FROM t;", "!1", "SELECT 2;"]:
+            self.tool.session.history.append_string(entry)
+
+        with patch.object(self.tool, "_execute_query") as mock_execute:
+            self.tool._handle_history_rerun("!3")
+        mock_execute.assert_called_once_with("SELECT 2;")
+
+    def test_14_csv_pandas_fallback(self):
+        """Verifies CSVs DuckDB cannot decode are still loaded through pandas."""
+        latin_path = os.path.join(self.test_dir, "legacy.csv")
+        with open(latin_path, "wb") as f:
+            f.write(b"name,qty\ncaf\xe9,1\ntea,2\n")
+
+        loaded = self.tool._load_data([latin_path])
+        self.assertEqual(loaded, ["legacy_csv"])
+
+        total = self.tool.db_connection.execute(
+            "SELECT SUM(qty) FROM legacy_csv"
+        ).fetchone()[0]
+        self.assertEqual(total, 3)
+        self.assertEqual(self.tool.schema_cache["legacy_csv"], ["name", "qty"])
+
+    def test_15_reload_replaces_registered_table(self):
+        """Verifies a reloaded name is rebound instead of shadowed by the old data."""
+        legacy_path = os.path.join(self.test_dir, "legacy.csv")
+        with open(legacy_path, "wb") as f:
+            f.write(b"name\ncaf\xe9\n")
+        self.tool._load_data([legacy_path])
+
+        with open(legacy_path, "w", encoding="utf-8") as f:
+            f.write("name\ntea\n")
+        self.tool._load_data([legacy_path])
+
+        rows = self.tool.db_connection.execute("SELECT name FROM legacy_csv").fetchall()
+        self.assertEqual(rows, [("tea",)])
+        self.assertEqual(self._table_names().count("legacy_csv"), 1)
+
+    def test_16_repeated_select_served_from_cache(self):
+        """Verifies a re-run SELECT reuses its preview until tables change."""
+        self.tool._load_data([self.csv_path])
+        self.tool.console.input = MagicMock(return_value="n")
+        query = "SELECT * FROM sales_2023_csv;"
+        self.tool._execute_query(query)
+
+        with patch("sheet_ql._fetch_arrow_reader") as mock_fetch:
+            self.tool._execute_query(query)
+        mock_fetch.assert_not_called()
+
+        self.tool._load_data([self.excel_path])
+        self.assertEqual(len(self.tool._query_cache), 0)
+
+    def test_17_unchanged_file_not_reloaded(self):
+        """Verifies loading an unmodified file again keeps its existing tables."""
+        self.tool._load_data([self.csv_path])
+
+        with patch.object(self.tool, "_create_view") as mock_view:
+            loaded = self.tool._load_data([self.csv_path])
+        mock_view.assert_not_called()
+        self.assertEqual(loaded, ["sales_2023_csv"])
+        self.assertEqual(len(self.tool.recorder.inputs), 1)
+
+        self.tool._execute_query("DROP VIEW sales_2023_csv")
+        self.tool._load_data([self.csv_path])
+        self.assertIn("sales_2023_csv", self.tool._current_tables())
+        self.assertEqual(len(self.tool.recorder.inputs), 2)
+
+    def test_18_meta_commands_dispatch_to_handlers(self):
+        """Verifies non-exit meta-commands run their handler and keep the loop going."""
+        with patch.object(
+            self.tool, "_list_tables", return_value=None
+        ) as mock_tables, patch.object(
+            self.tool, "_describe_table", return_value=None
+        ) as mock_describe:
+            self.assertFalse(self.tool._handle_meta_command(".tables"))
+            self.assertFalse(self.tool._handle_meta_command(".SCHEMA sales"))
+        mock_tables.assert_called_once_with()
+        mock_describe.assert_called_once_with([".SCHEMA", "sales"])
+        self.assertFalse(self.tool._handle_meta_command(".nope"))
+
+    def test_19_direct_sheet_read_without_excel_extension(self):
+        """Verifies sheets read cell-by-value into Arrow keep integer columns."""
+        self.tool._excel_extension_loaded = False
+        loaded = self.tool._load_data([self.excel_path])
+        self.assertEqual(loaded, ["targets_q1_targets"])
+        self.assertEqual(self.tool._table_sources["targets_q1_targets"], "registered")
+        self.assertEqual(
+            self.tool.column_types["targets_q1_targets"], ["VARCHAR", "BIGINT"]
+        )
+        total = self.tool.db_connection.execute(
+            "SELECT SUM(target) FROM targets_q1_targets"
+        ).fetchone()[0]
+        self.assertEqual(total, 1500)
+
+    def test_20_materialize_copies_into_tables(self):
+        """Verifies --materialize loads files as DuckDB tables that can be renamed."""
+        self.tool.materialize = True
+        self.tool._excel_extension_loaded = False
+        self.tool._load_data([self.csv_path, self.excel_path])
+
+        con = self.tool.db_connection
+        tables = [
+            r[0]
+            for r in con.execute("SELECT table_name FROM duckdb_tables()").fetchall()
+        ]
+        self.assertEqual(sorted(tables), ["sales_2023_csv", "targets_q1_targets"])
+
+        self.tool._handle_meta_command(".rename sales_2023_csv sales")
+        total = con.execute("SELECT SUM(amount) FROM sales").fetchone()[0]
+        self.assertEqual(total, 450)
+
+    def test_21_csv_view_with_quote_in_path(self):
+        """Verifies sniffed CSV views are built with the path escaped."""
+        quoted_dir = os.path.join(self.test_dir, "it's")
+        os.makedirs(quoted_dir)
+        quoted_path = os.path.join(quoted_dir, "q1.csv")
+        shutil.copy(self.csv_path, quoted_path)
+
+        self.assertEqual(self.tool._load_data([quoted_path]), ["q1_csv"])
+        self.assertEqual(
+            self.tool.column_types["q1_csv"], ["BIGINT", "VARCHAR", "BIGINT"]
+        )
+        total = self.tool.db_connection.execute(
+            "SELECT SUM(amount) FROM q1_csv"
+        ).fetchone()[0]
+        self.assertEqual(total, 450)
+
+    def test_22_yaml_alias_keeps_sheet_names(self):
+        """Verifies multi-sheet aliases replace the whole file stem, underscores included."""
+        book_path = os.path.join(self.test_dir, "sales_2023.xlsx")
+        with pd.ExcelWriter(book_path) as writer:
+            for sheet in ["Q1", "Q2"]:
+                pd.DataFrame({"v": [1]}).to_excel(writer, sheet_name=sheet, index=False)
+
+        self.tool._execute_yaml_script({"inputs": [{"path": book_path, "alias": "s"}]})
+        self.assertIn("s_q1", self.tool.schema_cache)
+        self.assertIn("s_q2", self.tool.schema_cache)
+
+    def test_23_failed_workbook_reload_keeps_old_tables(self):
+        """Verifies a rolled-back workbook reload keeps the old sheet reachable."""
+        self.tool._load_data([self.excel_path])
+        broken = [("targets_q1_targets", object())]
+        with patch.object(self.tool, "_is_unchanged", return_value=False):
+            with patch.object(self.tool, "_read_excel", return_value=broken):
+                self.tool._load_data([self.excel_path])
+            self.assertEqual(
+                self.tool._table_sources.get("targets_q1_targets"), "registered"
+            )
+            # Reloading as a table must drop the restored registration first.
+            self.tool.materialize = True
+            self.tool._load_data([self.excel_path])
+
+        rows = self.db_connection.execute(
+            "SELECT city FROM targets_q1_targets ORDER BY city"
+        ).fetchall()
+        self.assertEqual(rows, [("LA",), ("NY",)])
+        self.assertEqual(self._table_names().count("targets_q1_targets"), 1)
+
+    def test_24_cached_preview_tracks_file_changes(self):
+        """Verifies rewritten source files and volatile functions skip the preview cache."""
+        data_path = os.path.join(self.test_dir, "live.csv")
+        with open(data_path, "w", encoding="utf-8") as f:
+            f.write("a,b\n1,2\n")
+        self.tool._load_data([data_path])
+        self.tool.console.input = MagicMock(return_value="n")
+        query = "SELECT * FROM live_csv;"
+        self.tool._execute_query(query)
+
+        with open(data_path, "w", encoding="utf-8") as f:
+            f.write("a,b\n9,9\n99,99\n")
+        with patch.object(self.tool, "_display_results_table") as mock_display:
+            self.tool._execute_query(query)
+        preview = mock_display.call_args[0][0]
+        self.assertEqual(preview.column("a").to_pylist(), [9, 99])
+
+        for _ in range(2):
+            with patch("sheet_ql._fetch_arrow_reader") as mock_fetch:
+                self.tool._execute_query("SELECT random(), now();")
+            mock_fetch.assert_called_once()
+
+    def test_25_csv_view_follows_edited_file(self):
+        """Verifies a CSV view re-detects columns and types after the file changes."""
+        data_path = os.path.join(self.test_dir, "edited.csv")
+        with open(data_path, "w", encoding="utf-8") as f:
+            f.write("a,b\n1,2\n")
+        self.tool._load_data([data_path])
+
+        with open(data_path, "w", encoding="utf-8") as f:
+            f.write("a,b,c\n1,N/A,x\n")
+        rows = self.db_connection.execute("SELECT b, c FROM edited_csv").fetchall()
+        self.assertEqual(rows, [("N/A", "x")])
+
+    def test_26_export_after_rename_keeps_staged_results(self):
+        """Verifies exporting a staged SELECT whose table was renamed fails softly."""
+        self.tool._load_data([self.csv_path])
+        self.tool.results_to_save["s"] = self.db_connection.sql(
+            "SELECT * FROM sales_2023_csv"
+        )
+        self.tool._handle_meta_command(".rename sales_2023_csv sales")
+
+        self.tool._save_results(os.path.join(self.test_dir, "renamed.xlsx"))
+        self.assertIn("s", self.tool.results_to_save)
+
+    def test_27_blank_sheet_does_not_block_workbook(self):
+        """Verifies an empty sheet is skipped while the rest of the workbook loads."""
+        book_path = os.path.join(self.test_dir, "e.xlsx")
+        workbook = openpyxl.Workbook()
+        workbook.active.title = "Data"
+        workbook.active.append(["v"])
+        workbook.active.append([1])
+        workbook.create_sheet("Empty")
+        workbook.save(book_path)
+
+        self.assertEqual(self.tool._load_data([book_path]), ["e_data"])
+
+        # The pandas path used when the direct read fails skips it as well.
+        with patch.object(self.tool, "_is_unchanged", return_value=False):
+            with patch.object(self.tool, "_read_excel_direct", side_effect=OSError):
+                self.assertEqual(self.tool._load_data([book_path]), ["e_data"])
+
+    def test_28_reload_after_same_named_file_rebinds_table(self):
+        """Verifies a file is reloaded once another file took over its table name."""
+        paths = []
+        for folder, value in (("a", 1), ("b", 2)):
+            os.makedirs(os.path.join(self.test_dir, folder), exist_ok=True)
+            paths.append(os.path.join(self.test_dir, folder, "dup.csv"))
+            with open(paths[-1], "w", encoding="utf-8") as f:
+                f.write(f"v\n{value}\n")
+
+        self.tool._load_data([paths[0]])
+        self.tool._load_data([paths[1]])
+        self.tool._load_data([paths[0]])
+        rows = self.db_connection.execute("SELECT v FROM dup_csv").fetchall()
+        self.assertEqual(rows, [(1,)])
+
+    def test_29_export_blob_column(self):
+        """Verifies results with a BLOB column export to Excel as text."""
+        self.tool.results_to_save["blobs"] = self.db_connection.sql(
+            "SELECT '\\xFF\\x00'::BLOB AS payload"
+        )
+        save_path = os.path.join(self.test_dir, "blobs.xlsx")
+        self.tool._save_results(save_path)
+
+        sheet = openpyxl.load_workbook(save_path)["blobs"]
+        self.assertEqual(sheet["A2"].value, str(b"\xff\x00"))
+
+    def test_30_excel_export_intervals_and_failed_writes(self):
+        """Verifies INTERVALs export as text and a failed export leaves no file."""
+        self.tool.results_to_save["spans"] = self.db_connection.sql(
+            "SELECT INTERVAL '1 month 2 days 3 seconds' AS span"
+        )
+        save_path = os.path.join(self.test_dir, "spans.xlsx")
+        self.tool._save_to_excel(save_path)
+        sheet = openpyxl.load_workbook(save_path)["spans"]
+        self.assertEqual(sheet["A2"].value, "P1M2DT3S")
+
+        self.tool.results_to_save["ok"] = self.db_connection.sql("SELECT 1 AS v")
+        self.tool.results_to_save["bad"] = self.db_connection.sql(
+            "SELECT error('boom') AS v"
+        )
+        failed_path = os.path.join(self.test_dir, "failed.xlsx")
+        self.tool._save_to_excel(failed_path)
+        self.assertFalse(os.path.exists(failed_path))
+        self.assertIn("bad", self.tool.results_to_save)
+
+    def test_31_path_list_keeps_apostrophes(self):
+        """Verifies apostrophes in paths don't merge a comma-separated path list."""
+        self.assertEqual(
+            _split_path_list("/data/O'Brien/a.csv, /data/O'Neil/b.csv"),
+            ["/data/O'Brien/a.csv", "/data/O'Neil/b.csv"],
+        )
+        self.assertEqual(
+            _split_path_list('"C:\\My, Files\\a.csv", b.csv'),
+            ["C:\\My, Files\\a.csv", "b.csv"],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()